@@ -12,531 +12,704 @@ Author: Momeni Gilles
 Date: January 2026
 """
 
-import warnings
-warnings.filterwarnings('default')
-
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib import font_manager
 import numpy as np
+import argparse
+import gzip
+import hashlib
+import json
 import os
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pyarrow import feather
 
 # ============================================================================
 # MATPLOTLIB SETUP
 # ============================================================================
+# Chart style, applied through plt.rc_context around each chart and the
+# shared Figure's creation, so the caller's rcParams are never modified
+CHART_STYLE = {
+    # The parts of the seaborn-v0_8 look the charts rely on: light grey
+    # panels with white gridlines behind the data, no axes frame or ticks,
+    # and no top/right spines on any chart
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.linewidth': 0,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelsize': 11,
+    'axes.labelcolor': '.15',
+    'grid.color': 'white',
+    'grid.linewidth': 1.0,
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.major.size': 0,
+    'ytick.major.size': 0,
+    'xtick.minor.size': 0,
+    'ytick.minor.size': 0,
+    'xtick.major.pad': 7,
+    'ytick.major.pad': 7,
+    'legend.frameon': False,
+    'patch.linewidth': 0.3,
+    'lines.solid_capstyle': 'round',
+    # Labels are French/English only, so a single family covers every glyph
+    # and text rendering never walks a fallback list
+    'font.family': 'DejaVu Sans',
+    'axes.unicode_minus': False,
+    'figure.dpi': 150,
+    # Lay figures out during the draw that savefig already does, rather than
+    # in a separate tight_layout() pass per chart
+    'figure.constrained_layout.use': True,
+    # Bar and line charts carry no sub-percent detail, so 100 dpi is enough;
+    # only the heatmap is saved at 150 dpi
+    'savefig.dpi': 100,
+    'path.simplify': True,
+    'agg.path.chunksize': 10000,
+}
+
 def setup_matplotlib_for_plotting():
-    """Setup matplotlib for non-interactive plotting with proper fonts."""
-    plt.switch_backend("Agg")
-    plt.style.use("seaborn-v0_8")
-    sns.set_palette("husl")
-    plt.rcParams["font.sans-serif"] = ["Noto Sans CJK SC", "WenQuanYi Zen Hei", 
-                                        "PingFang SC", "Arial Unicode MS", 
-                                        "Hiragino Sans GB", "DejaVu Sans"]
-    plt.rcParams["axes.unicode_minus"] = False
-    plt.rcParams['figure.dpi'] = 150
-    plt.rcParams['savefig.dpi'] = 150
-
-setup_matplotlib_for_plotting()
-
-# Create output directory
-os.makedirs('output', exist_ok=True)
+    """Resolve the chart font up front so later figures hit the lookup cache.
+
+    Runs as the chart pool's initializer. The style itself comes from
+    CHART_STYLE per chart, so no global rcParams are touched.
+    """
+    font_manager.findfont(CHART_STYLE['font.family'])
+
+# One Figure per process is cleared and reused for every chart it draws,
+# instead of allocating and tearing down a canvas per chart
+_figure = None
+
+def get_figure(width, height):
+    """Return this process's shared Figure, cleared and resized to width x height inches."""
+    global _figure
+    if _figure is None:
+        # dpi and the layout engine are fixed when the Figure is created
+        with plt.rc_context(CHART_STYLE):
+            _figure = plt.figure()
+    _figure.clear()
+    _figure.set_size_inches(width, height)
+    return _figure
+
+def save_chart(fig, filename, **kwargs):
+    """Save a chart to output/ and return its filename.
+
+    PNGs are written at zlib level 1: encoding is most of savefig's cost at
+    these sizes, and the files come out only slightly larger. The Software
+    text chunk (the matplotlib version string) is dropped as well.
+    """
+    fig.savefig(os.path.join('output', filename), bbox_inches='tight', facecolor='white',
+                pil_kwargs={'compress_level': 1, 'optimize': False},
+                metadata={'Software': None}, **kwargs)
+    return filename
 
 # ============================================================================
-# DATA EXTRACTION FROM EXCEL FILES
+# DATA LOADING HELPERS
 # ============================================================================
-print("="*70)
-print("EXTRACTING DATA FROM EXCEL FILES")
-print("="*70)
-
-# Load all Excel files
-df_diarrhea = pd.read_excel('user_input_files/Tables_DIAR.xls', sheet_name='Diarrhea')
-df_feeding = pd.read_excel('user_input_files/Tables_DIAR.xls', sheet_name='Feeding')
-df_ors = pd.read_excel('user_input_files/Tables_DIAR.xls', sheet_name='ORS')
-df_ari = pd.read_excel('user_input_files/Tables_ARI_FV.xls', sheet_name='ARI')
-df_fever = pd.read_excel('user_input_files/Tables_ARI_FV.xls', sheet_name='Fever')
-
-# --- Extract Total Values ---
+# Parsing the .xls workbooks dominates the run time, so each sheet is
+# converted to Feather on first use and reloaded from there afterwards.
+CACHE_DIR = 'user_input_files/.cache'
+
+# Sheets read from each workbook
+WORKBOOK_SHEETS = {
+    'user_input_files/Tables_DIAR.xls': ['Diarrhea', 'Feeding', 'ORS'],
+    'user_input_files/Tables_ARI_FV.xls': ['ARI', 'Fever'],
+}
+
+# Columns used downstream from each sheet (besides row_labels); the DHS
+# tables carry many more indicator columns that are never parsed
+SHEET_COLUMNS = {
+    'Diarrhea': {
+        'Diarrhea in the 2 weeks before the survey|Yes',
+        'Diarrhea in the 2 weeks before the survey|No',
+        'Advice or treatment sought for diarrhea|Yes',
+    },
+    'Feeding': {
+        'Amount of liquids given for child with diarrhea|More',
+        'Amount of liquids given for child with diarrhea|Same as usual',
+        'Amount of liquids given for child with diarrhea|Somewhat less',
+        'Amount of liquids given for child with diarrhea|Much less',
+        'Amount of liquids given for child with diarrhea|None',
+        'Amount of food given for child with diarrhea|More',
+        'Amount of food given for child with diarrhea|Same as usual',
+        'Amount of food given for child with diarrhea|Somewhat less',
+        'Amount of food given for child with diarrhea|Much less',
+        'Amount of food given for child with diarrhea|None',
+    },
+    'ORS': {
+        'Given oral rehydration salts for diarrhea|Yes',
+        'Given recommended homemade fluids for diarrhea|Yes',
+        'Given either ORS or RHF for diarrhea|Yes',
+        'Given zinc for diarrhea|Yes',
+        'Given zinc and ORS for diarrhea|Yes',
+        'Given ORS or increased fluids for diarrhea|Yes',
+        'Given oral rehydration treatment or increased liquids for diarrhea|Yes',
+        'Given antibiotic drugs for diarrhea|Yes',
+        'Given home remedy or other treatment for diarrhea|Yes',
+        'No treatment for diarrhea|Yes',
+    },
+    'ARI': {
+        'ARI symptoms in the 2 weeks before the survey|Yes',
+        'ARI symptoms in the 2 weeks before the survey|No',
+        'Advice or treatment sought for ARI symptoms|Yes',
+    },
+    'Fever': {
+        'Fever symptoms in the 2 weeks before the survey|Yes',
+        'Fever symptoms in the 2 weeks before the survey|No',
+        'Advice or treatment sought for fever symptoms|Yes',
+    },
+}
+
+def open_workbook(xls_path):
+    """Open an Excel workbook with calamine, falling back to xlrd if it is missing."""
+    try:
+        return pd.ExcelFile(xls_path, engine='calamine')
+    # ImportError: python-calamine is not installed; ValueError: pandas < 2.2
+    # does not know the engine at all
+    except (ImportError, ValueError):
+        return pd.ExcelFile(xls_path, engine='xlrd')
+
+def file_sha1(path):
+    """Return the SHA-1 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def load_sheets(xls_path, sheets, use_cache=True):
+    """Load sheets from an Excel file, using the Feather cache when it is fresh.
+
+    Cache entries are keyed on the SHA-1 of the workbook bytes, so touching or
+    copying the file does not invalidate them. Only row_labels and the sheet's
+    SHEET_COLUMNS are read. The workbook is opened at most once, and only if a
+    sheet is missing from the cache or stale. With use_cache=False the cache
+    is neither read nor written.
+    """
+    sha1 = file_sha1(xls_path) if use_cache else None
+    frames = {}
+    stale = []
+    for sheet in sheets:
+        meta = {'sha1': sha1, 'columns': sorted(SHEET_COLUMNS[sheet])}
+        cache_path = os.path.join(CACHE_DIR, f'{os.path.basename(xls_path)}.{sheet}.feather')
+        meta_path = cache_path + '.json'
+        if use_cache and os.path.exists(cache_path):
+            # A missing or unreadable sidecar (e.g. cut short by an interrupted
+            # run) just marks the sheet as stale
+            try:
+                with open(meta_path) as f:
+                    fresh = json.load(f) == meta
+            except (OSError, ValueError):
+                fresh = False
+            if fresh:
+                frames[sheet] = feather.read_feather(cache_path, memory_map=True)
+                continue
+        stale.append((sheet, meta, cache_path, meta_path))
+
+    if stale:
+        if use_cache:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+        with open_workbook(xls_path) as xl:
+            for sheet, meta, cache_path, meta_path in stale:
+                columns = SHEET_COLUMNS[sheet]
+                df = xl.parse(sheet, usecols=lambda c: c == 'row_labels' or c in columns)
+                if use_cache:
+                    df.to_feather(cache_path)
+                    with open(meta_path, 'w') as f:
+                        json.dump(meta, f)
+                frames[sheet] = df
+    return frames
+
+def index_by_label(df):
+    """Index a table by (category, label), lowercased, from its hierarchical row labels.
+
+    '1|region|adamawa' becomes ('region', 'adamawa') and '1|#Total' becomes
+    ('', 'total'). Leaves such as 'other' can repeat across categories, so the
+    category stays in the key. The '#Weighted N' rows repeat under every
+    category and are dropped; any other repeated key is an error.
+    """
+    parts = df['row_labels'].str.split('|')
+    category = parts.str[1:-1].str.join('|').str.strip().str.lower().rename('_category')
+    label = parts.str[-1].str.lstrip('#').str.strip().str.lower().rename('_label')
+    df = df.set_index([category, label])
+    df = df[df.index.get_level_values('_label') != 'weighted n']
+    if not df.index.is_unique:
+        duplicates = df.index[df.index.duplicated()].unique().tolist()
+        raise ValueError(f"Duplicate row labels in sheet: {duplicates}")
+    return df
+
 def get_total_row(df):
-    """Get the Total row from a dataframe."""
-    return df[df['row_labels'].str.contains('Total', case=False, na=False)].iloc[0]
-
-# Diarrhea totals
-diarrhea_total = get_total_row(df_diarrhea)
-diarrhea_prev = diarrhea_total['Diarrhea in the 2 weeks before the survey|Yes']
-diarrhea_treat = diarrhea_total['Advice or treatment sought for diarrhea|Yes']
-
-# ARI totals
-ari_total = get_total_row(df_ari)
-ari_prev = ari_total['ARI symptoms in the 2 weeks before the survey|Yes']
-ari_treat = ari_total['Advice or treatment sought for ARI symptoms|Yes']
-
-# Fever totals
-fever_total = get_total_row(df_fever)
-fever_prev = fever_total['Fever symptoms in the 2 weeks before the survey|Yes']
-fever_treat = fever_total['Advice or treatment sought for fever symptoms|Yes']
-
-print(f"  Diarrhea: {diarrhea_prev:.1f}% prevalence, {diarrhea_treat:.1f}% treatment")
-print(f"  Fever: {fever_prev:.1f}% prevalence, {fever_treat:.1f}% treatment")
-print(f"  ARI: {ari_prev:.1f}% prevalence, {ari_treat:.1f}% treatment")
-
-# --- Extract Diarrhea by Age ---
-age_labels_raw = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59']
-diarrhea_by_age = []
-for label in age_labels_raw:
-    row = df_diarrhea[df_diarrhea['row_labels'].str.contains(f'|{label}', regex=False, na=False)]
-    if not row.empty:
-        diarrhea_by_age.append(row.iloc[0]['Diarrhea in the 2 weeks before the survey|Yes'])
-    else:
-        diarrhea_by_age.append(0)
-
-print(f"  Diarrhea by age: {[round(x,1) for x in diarrhea_by_age]}")
-
-# --- Extract ORS Treatment Data ---
-ors_total = get_total_row(df_ors)
-ors_rate = ors_total['Given oral rehydration salts for diarrhea|Yes']
-rhf_rate = ors_total['Given recommended homemade fluids for diarrhea|Yes']
-ors_rhf = ors_total['Given either ORS or RHF for diarrhea|Yes']
-zinc_rate = ors_total['Given zinc for diarrhea|Yes']
-ors_zinc = ors_total['Given zinc and ORS for diarrhea|Yes']
-ors_fluids = ors_total['Given ORS or increased fluids for diarrhea|Yes']
-tro_rate = ors_total['Given oral rehydration treatment or increased liquids for diarrhea|Yes']
-antibiotics = ors_total['Given antibiotic drugs for diarrhea|Yes']
-home_remedy = ors_total['Given home remedy or other treatment for diarrhea|Yes']
-no_treatment = ors_total['No treatment for diarrhea|Yes']
-
-print(f"  ORS: {ors_rate:.1f}%, TRO: {tro_rate:.1f}%, No treatment: {no_treatment:.1f}%")
-
-# --- Extract ORS by Wealth Quintile ---
-wealth_labels = ['poorest', 'poorer', 'middle', 'richer', 'richest']
-ors_by_wealth = []
-for w in wealth_labels:
-    row = df_ors[df_ors['row_labels'].str.contains(w, case=False, na=False)]
-    if not row.empty:
-        ors_by_wealth.append(row.iloc[0]['Given oral rehydration salts for diarrhea|Yes'])
-
-print(f"  ORS by wealth: {[round(x,1) for x in ors_by_wealth]}")
-
-# --- Extract Care-seeking by Education ---
-edu_labels = ['no education', 'primary', 'secondary', 'higher']
-care_by_edu = []
-for e in edu_labels:
-    row = df_fever[df_fever['row_labels'].str.contains(e, case=False, na=False)]
-    if not row.empty and 'Weighted' not in row.iloc[0]['row_labels']:
-        care_by_edu.append(row.iloc[0]['Advice or treatment sought for fever symptoms|Yes'])
-
-print(f"  Care-seeking by education: {[round(x,1) for x in care_by_edu]}")
-
-# --- Extract Feeding Data ---
-feeding_total = get_total_row(df_feeding)
-liquid_more = feeding_total['Amount of liquids given for child with diarrhea|More']
-liquid_same = feeding_total['Amount of liquids given for child with diarrhea|Same as usual']
-liquid_less = feeding_total['Amount of liquids given for child with diarrhea|Somewhat less']
-liquid_much_less = feeding_total['Amount of liquids given for child with diarrhea|Much less']
-liquid_none = feeding_total['Amount of liquids given for child with diarrhea|None']
-
-food_more = feeding_total['Amount of food given for child with diarrhea|More']
-food_same = feeding_total['Amount of food given for child with diarrhea|Same as usual']
-food_less = feeding_total['Amount of food given for child with diarrhea|Somewhat less']
-food_much_less = feeding_total['Amount of food given for child with diarrhea|Much less']
-food_none = feeding_total['Amount of food given for child with diarrhea|None']
-
-print(f"  Liquids: More {liquid_more:.1f}%, Same {liquid_same:.1f}%")
-print(f"  Food: More {food_more:.1f}%, Same {food_same:.1f}%")
-
-# --- Extract Regional Data ---
-regions_list = ['adamawa', 'centre (without yaounde)', 'douala', 'east', 'far-north',
-                'littoral (without douala)', 'north', 'north-west', 'west', 'south', 
-                'south-west', 'yaounde']
-region_names = ['Adamawa', 'Centre (Without Yaounde)', 'Douala', 'East', 'Far-North',
-                'Littoral (Without Douala)', 'North', 'North-West', 'West', 'South',
-                'South-West', 'Yaounde']
-
-regional_data = {'Region': [], 'Diarrhea': [], 'Fever': [], 'Ari': []}
-for i, reg in enumerate(regions_list):
-    # Get diarrhea (NO symptom column)
-    d_row = df_diarrhea[df_diarrhea['row_labels'].str.contains(reg, case=False, na=False)]
-    f_row = df_fever[df_fever['row_labels'].str.contains(reg, case=False, na=False)]
-    a_row = df_ari[df_ari['row_labels'].str.contains(reg, case=False, na=False)]
-    
-    if not d_row.empty and not f_row.empty and not a_row.empty:
-        regional_data['Region'].append(region_names[i])
-        regional_data['Diarrhea'].append(d_row.iloc[0]['Diarrhea in the 2 weeks before the survey|No'])
-        regional_data['Fever'].append(f_row.iloc[0]['Fever symptoms in the 2 weeks before the survey|No'])
-        regional_data['Ari'].append(a_row.iloc[0]['ARI symptoms in the 2 weeks before the survey|No'])
-
-regional_df = pd.DataFrame(regional_data)
-print(f"  Loaded regional data for {len(regional_df)} regions")
+    """Get the Total row from a dataframe indexed by index_by_label."""
+    return df.loc[('', 'total')]
+
+def get_category_rows(df, category):
+    """Get one category's rows from a dataframe indexed by index_by_label, keyed by label."""
+    return df.xs(category, level='_category')
 
 # ============================================================================
 # CHART 1: Graphique 10.8 - Prevalence and Treatment (French Style)
 # ============================================================================
-print("\n" + "="*70)
-print("GENERATING CHARTS")
-print("="*70)
-
-fig, axes = plt.subplots(1, 2, figsize=(12, 5))
-
-# Left: Prevalence
-categories = ['IRA', 'Fièvre', 'Diarrhée']
-prevalence = [round(ari_prev), round(fever_prev), round(diarrhea_prev)]
-ax1 = axes[0]
-bars1 = ax1.bar(categories, prevalence, color='#808000', width=0.6)
-ax1.set_ylabel('')
-ax1.set_ylim(0, 20)
-ax1.set_title("Pourcentage d'enfants de moins de 5 ans ayant présenté\ndes symptômes au cours des 2 semaines avant l'interview", 
-              fontsize=9, pad=10)
-ax1.spines['top'].set_visible(False)
-ax1.spines['right'].set_visible(False)
-for bar, val in zip(bars1, prevalence):
-    ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, f'{val}%', 
-             ha='center', va='bottom', fontweight='bold', fontsize=12)
-
-# Right: Treatment
-treatment = [round(ari_treat), round(fever_treat), round(diarrhea_treat)]
-ax2 = axes[1]
-bars2 = ax2.bar(categories, treatment, color='#87CEEB', width=0.6)
-ax2.set_ylabel('')
-ax2.set_ylim(0, 80)
-ax2.set_title("Parmi ces enfants malades, pourcentage pour lesquels\non a recherché des conseils ou un traitement", 
-              fontsize=9, pad=10)
-ax2.spines['top'].set_visible(False)
-ax2.spines['right'].set_visible(False)
-for bar, val in zip(bars2, treatment):
-    ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, f'{val}%', 
-             ha='center', va='bottom', fontweight='bold', fontsize=12)
-
-fig.suptitle("Graphique 10.8 Prévalence et traitement des maladies infantiles", 
-             fontsize=14, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig('output/graphique_10_8_prevalence_treatment.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: graphique_10_8_prevalence_treatment.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_1(stats, filename):
+    """Graphique 10.8 - Prevalence and Treatment (French Style)."""
+    ari_prev = stats['ari_prev']
+    fever_prev = stats['fever_prev']
+    diarrhea_prev = stats['diarrhea_prev']
+    ari_treat = stats['ari_treat']
+    fever_treat = stats['fever_treat']
+    diarrhea_treat = stats['diarrhea_treat']
+
+    fig = get_figure(12, 5)
+    axes = fig.subplots(1, 2)
+
+    # Left: Prevalence
+    categories = ['IRA', 'Fièvre', 'Diarrhée']
+    prevalence = np.rint([ari_prev, fever_prev, diarrhea_prev]).astype(int).tolist()
+    ax1 = axes[0]
+    bars1 = ax1.bar(categories, prevalence, color='#808000', width=0.6)
+    ax1.set_ylabel('')
+    ax1.set_ylim(0, 20)
+    ax1.set_title("Pourcentage d'enfants de moins de 5 ans ayant présenté\ndes symptômes au cours des 2 semaines avant l'interview", 
+                  fontsize=9, pad=10)
+    ax1.bar_label(bars1, labels=[f'{v}%' for v in prevalence], padding=3,
+                  fontweight='bold', fontsize=12)
+
+    # Right: Treatment
+    treatment = np.rint([ari_treat, fever_treat, diarrhea_treat]).astype(int).tolist()
+    ax2 = axes[1]
+    bars2 = ax2.bar(categories, treatment, color='#87CEEB', width=0.6)
+    ax2.set_ylabel('')
+    ax2.set_ylim(0, 80)
+    ax2.set_title("Parmi ces enfants malades, pourcentage pour lesquels\non a recherché des conseils ou un traitement", 
+                  fontsize=9, pad=10)
+    ax2.bar_label(bars2, labels=[f'{v}%' for v in treatment], padding=3,
+                  fontweight='bold', fontsize=12)
+
+    fig.suptitle("Graphique 10.8 Prévalence et traitement des maladies infantiles", 
+                 fontsize=14, fontweight='bold')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 2: Graphique 10.6 - Diarrhea by Age (French Style)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-
-age_labels = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59', 'Ensemble']
-diarrhea_values = [round(x) for x in diarrhea_by_age] + [round(diarrhea_prev)]
-colors = ['#4472C4'] * 6 + ['#70AD47']
-
-bars = ax.bar(age_labels, diarrhea_values, color=colors, width=0.7)
-ax.set_xlabel('Âge en mois', fontsize=11)
-ax.set_ylabel('')
-ax.set_ylim(0, 30)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-
-for bar, val in zip(bars, diarrhea_values):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, f'{val}%', 
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-ax.set_title("Graphique 10.6 Prévalence de la diarrhée, par âge\n"
-             "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'enquête",
-             fontsize=11, fontweight='bold', loc='left')
-plt.tight_layout()
-plt.savefig('output/graphique_10_6_diarrhea_age.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: graphique_10_6_diarrhea_age.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_2(stats, filename):
+    """Graphique 10.6 - Diarrhea by Age (French Style)."""
+    diarrhea_by_age = stats['diarrhea_by_age']
+    diarrhea_prev = stats['diarrhea_prev']
+
+    fig = get_figure(10, 6)
+    ax = fig.subplots()
+
+    age_labels = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59', 'Ensemble']
+    diarrhea_values = np.rint(diarrhea_by_age + [diarrhea_prev]).astype(int).tolist()
+    colors = ['#4472C4'] * 6 + ['#70AD47']
+
+    bars = ax.bar(age_labels, diarrhea_values, color=colors, width=0.7)
+    ax.set_xlabel('Âge en mois', fontsize=11)
+    ax.set_ylabel('')
+    ax.set_ylim(0, 30)
+
+    ax.bar_label(bars, labels=[f'{v}%' for v in diarrhea_values], padding=3,
+                 fontweight='bold', fontsize=11)
+
+    ax.set_title("Graphique 10.6 Prévalence de la diarrhée, par âge\n"
+                 "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'enquête",
+                 fontsize=11, fontweight='bold', loc='left')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 3: Graphique 10.5 - Diarrhea Treatment (French Horizontal Bar)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 8))
-
-treatment_labels = [
-    'Recherche conseil/traitement',
-    'SRO (sachet)',
-    'Solution maison recommandée',
-    'SRO ou SMR',
-    'Zinc',
-    'SRO et zinc',
-    'SRO ou liquides augmentés',
-    'TRO',
-    'Antibiotiques',
-    'Remède maison/autre',
-    'Aucun traitement'
-]
-treatment_values = [
-    round(diarrhea_treat),  # 52
-    round(ors_rate),        # 18
-    round(rhf_rate),        # 11
-    round(ors_rhf),         # 23
-    round(zinc_rate),       # 21
-    round(ors_zinc),        # 8
-    round(ors_fluids),      # 42
-    round(tro_rate),        # 45
-    round(antibiotics),     # 21
-    round(home_remedy),     # 25
-    round(no_treatment)     # 23
-]
-treatment_colors = ['#E74C3C', '#F39C12', '#F39C12', '#F39C12', '#3498DB', 
-                    '#F39C12', '#F39C12', '#27AE60', '#2C3E50', '#2C3E50', '#2C3E50']
-
-# Reverse for horizontal bar
-y_pos = np.arange(len(treatment_labels))
-bars = ax.barh(y_pos, treatment_values, color=treatment_colors, height=0.7)
-ax.set_yticks(y_pos)
-ax.set_yticklabels(treatment_labels)
-ax.invert_yaxis()
-ax.set_xlim(0, 60)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-
-for bar, val in zip(bars, treatment_values):
-    ax.text(val + 1, bar.get_y() + bar.get_height()/2, f'{val}', 
-            ha='left', va='center', fontweight='bold', fontsize=10)
-
-ax.set_title("Graphique 10.5 Traitement de la diarrhée\n"
-             "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'interview",
-             fontsize=11, fontweight='bold', loc='left')
-plt.tight_layout()
-plt.savefig('output/graphique_10_5_diarrhea_treatment.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: graphique_10_5_diarrhea_treatment.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_3(stats, filename):
+    """Graphique 10.5 - Diarrhea Treatment (French Horizontal Bar)."""
+    diarrhea_treat = stats['diarrhea_treat']
+    ors_rate = stats['ors_rate']
+    rhf_rate = stats['rhf_rate']
+    ors_rhf = stats['ors_rhf']
+    zinc_rate = stats['zinc_rate']
+    ors_zinc = stats['ors_zinc']
+    ors_fluids = stats['ors_fluids']
+    tro_rate = stats['tro_rate']
+    antibiotics = stats['antibiotics']
+    home_remedy = stats['home_remedy']
+    no_treatment = stats['no_treatment']
+
+    fig = get_figure(10, 8)
+    ax = fig.subplots()
+
+    treatment_labels = [
+        'Recherche conseil/traitement',
+        'SRO (sachet)',
+        'Solution maison recommandée',
+        'SRO ou SMR',
+        'Zinc',
+        'SRO et zinc',
+        'SRO ou liquides augmentés',
+        'TRO',
+        'Antibiotiques',
+        'Remède maison/autre',
+        'Aucun traitement'
+    ]
+    treatment_values = np.rint([
+        diarrhea_treat,  # 52
+        ors_rate,        # 18
+        rhf_rate,        # 11
+        ors_rhf,         # 23
+        zinc_rate,       # 21
+        ors_zinc,        # 8
+        ors_fluids,      # 42
+        tro_rate,        # 45
+        antibiotics,     # 21
+        home_remedy,     # 25
+        no_treatment     # 23
+    ]).astype(int).tolist()
+    treatment_colors = ['#E74C3C', '#F39C12', '#F39C12', '#F39C12', '#3498DB', 
+                        '#F39C12', '#F39C12', '#27AE60', '#2C3E50', '#2C3E50', '#2C3E50']
+
+    # invert_yaxis() draws the bars top-to-bottom in list order, no reversal needed
+    y_pos = np.arange(len(treatment_labels))
+    bars = ax.barh(y_pos, treatment_values, color=treatment_colors, height=0.7)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(treatment_labels)
+    ax.invert_yaxis()
+    ax.set_xlim(0, 60)
+
+    ax.bar_label(bars, labels=[f'{v}' for v in treatment_values], padding=3,
+                 fontweight='bold', fontsize=10)
+
+    ax.set_title("Graphique 10.5 Traitement de la diarrhée\n"
+                 "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'interview",
+                 fontsize=11, fontweight='bold', loc='left')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 4: Graphique 10.7 - Feeding Practices (French Stacked Bar)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(12, 4))
-
-# Data
-categories = ['Aliments donnés\n(par rapport à la normale)', 'Liquides donnés\n(par rapport à la normale)']
-data = {
-    'Davantage': [round(food_more), round(liquid_more)],
-    'Même': [round(food_same), round(liquid_same)],
-    'Moins': [round(food_less), round(liquid_less)],
-    'Rien': [round(food_none), round(liquid_none)]
-}
-colors = {'Davantage': '#27AE60', 'Même': '#3498DB', 'Moins': '#F39C12', 'Rien': '#C0392B'}
-
-# Create stacked horizontal bar
-y_pos = np.arange(len(categories))
-left = np.zeros(len(categories))
-
-for label, values in data.items():
-    bars = ax.barh(y_pos, values, left=left, label=label, color=colors[label], height=0.5)
-    # Add labels
-    for i, (bar, val) in enumerate(zip(bars, values)):
-        if val > 5:
-            ax.text(left[i] + val/2, bar.get_y() + bar.get_height()/2, f'{val}%',
-                    ha='center', va='center', fontweight='bold', fontsize=10, color='white')
-    left += values
-
-ax.set_yticks(y_pos)
-ax.set_yticklabels(categories)
-ax.set_xlim(0, 100)
-ax.legend(loc='lower center', ncol=4, bbox_to_anchor=(0.5, -0.3))
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-
-ax.set_title("Graphique 10.7 Pratiques alimentaires pendant la diarrhée\n"
-             "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'interview",
-             fontsize=11, fontweight='bold', loc='left')
-plt.tight_layout()
-plt.savefig('output/graphique_10_7_feeding_practices.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: graphique_10_7_feeding_practices.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_4(stats, filename):
+    """Graphique 10.7 - Feeding Practices (French Stacked Bar)."""
+    food_more = stats['food_more']
+    food_same = stats['food_same']
+    food_less = stats['food_less']
+    food_none = stats['food_none']
+    liquid_more = stats['liquid_more']
+    liquid_same = stats['liquid_same']
+    liquid_less = stats['liquid_less']
+    liquid_none = stats['liquid_none']
+
+    fig = get_figure(12, 4)
+    ax = fig.subplots()
+
+    # Data
+    categories = ['Aliments donnés\n(par rapport à la normale)', 'Liquides donnés\n(par rapport à la normale)']
+    labels = ['Davantage', 'Même', 'Moins', 'Rien']
+    colors = ['#27AE60', '#3498DB', '#F39C12', '#C0392B']
+    vals = np.rint([[food_more, liquid_more],
+                    [food_same, liquid_same],
+                    [food_less, liquid_less],
+                    [food_none, liquid_none]]).astype(int)
+    # Each segment starts where the previous ones end
+    lefts = np.vstack([np.zeros(len(categories), dtype=int), np.cumsum(vals, axis=0)[:-1]])
+
+    # Create stacked horizontal bar
+    y_pos = np.arange(len(categories))
+    for label, color, values, left in zip(labels, colors, vals, lefts):
+        bars = ax.barh(y_pos, values, left=left, label=label, color=color, height=0.5)
+        # Add labels (segments of 5% or less are too narrow for one)
+        ax.bar_label(bars, labels=[f'{v}%' if v > 5 else '' for v in values],
+                     label_type='center', fontweight='bold', fontsize=10, color='white')
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories)
+    ax.set_xlim(0, 100)
+    ax.legend(loc='lower center', ncol=4, bbox_to_anchor=(0.5, -0.3))
+
+    ax.set_title("Graphique 10.7 Pratiques alimentaires pendant la diarrhée\n"
+                 "Pourcentage d'enfants de moins de 5 ans ayant eu la diarrhée au cours des 2 semaines avant l'interview",
+                 fontsize=11, fontweight='bold', loc='left')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 5: Figure 5 - ORS by Wealth Quintile (Rainbow Gradient)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-
-wealth_display = ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']
-wealth_colors = ['#C0392B', '#E67E22', '#F1C40F', '#27AE60', '#145A32']
-
-bars = ax.bar(wealth_display, ors_by_wealth, color=wealth_colors, width=0.6)
-ax.set_xlabel('Wealth Quintile', fontsize=11)
-ax.set_ylabel('ORS Treatment Rate (%)', fontsize=11)
-ax.set_ylim(0, 35)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, ors_by_wealth):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, f'{val:.1f}%', 
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-ax.set_title("Figure 5: ORS Treatment for Diarrhea by Wealth Quintile\nCameroon DHS 2018",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig5_ors_wealth.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig5_ors_wealth.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_5(stats, filename):
+    """Figure 5 - ORS by Wealth Quintile (Rainbow Gradient)."""
+    ors_by_wealth = stats['ors_by_wealth']
+
+    fig = get_figure(10, 6)
+    ax = fig.subplots()
+
+    wealth_display = ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']
+    wealth_colors = ['#C0392B', '#E67E22', '#F1C40F', '#27AE60', '#145A32']
+
+    bars = ax.bar(wealth_display, ors_by_wealth, color=wealth_colors, width=0.6)
+    ax.set_xlabel('Wealth Quintile', fontsize=11)
+    ax.set_ylabel('ORS Treatment Rate (%)', fontsize=11)
+    ax.set_ylim(0, 35)
+    ax.grid(axis='y', alpha=0.3)
+
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in ors_by_wealth], padding=3,
+                 fontweight='bold', fontsize=11)
+
+    ax.set_title("Figure 5: ORS Treatment for Diarrhea by Wealth Quintile\nCameroon DHS 2018",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 6: Figure 7 - Care-seeking by Education (Green Gradient)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-
-edu_display = ['No Education', 'Primary', 'Secondary', 'Higher']
-edu_colors = ['#A9DFBF', '#52BE80', '#27AE60', '#145A32']
-
-bars = ax.bar(edu_display, care_by_edu, color=edu_colors, width=0.6)
-ax.set_xlabel("Mother's Education Level", fontsize=11)
-ax.set_ylabel('Care-Seeking Rate (%)', fontsize=11)
-ax.set_ylim(0, 75)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, care_by_edu):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, f'{val:.1f}%', 
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-ax.set_title("Figure 7: Care-Seeking for Fever by Mother's Education\nCameroon DHS 2018",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig7_careseeking_education.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig7_careseeking_education.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_6(stats, filename):
+    """Figure 7 - Care-seeking by Education (Green Gradient)."""
+    care_by_edu = stats['care_by_edu']
+
+    fig = get_figure(10, 6)
+    ax = fig.subplots()
+
+    edu_display = ['No Education', 'Primary', 'Secondary', 'Higher']
+    edu_colors = ['#A9DFBF', '#52BE80', '#27AE60', '#145A32']
+
+    bars = ax.bar(edu_display, care_by_edu, color=edu_colors, width=0.6)
+    ax.set_xlabel("Mother's Education Level", fontsize=11)
+    ax.set_ylabel('Care-Seeking Rate (%)', fontsize=11)
+    ax.set_ylim(0, 75)
+    ax.grid(axis='y', alpha=0.3)
+
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in care_by_edu], padding=3,
+                 fontweight='bold', fontsize=11)
+
+    ax.set_title("Figure 7: Care-Seeking for Fever by Mother's Education\nCameroon DHS 2018",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 7: Figure 8 - Regional Heatmap
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 8))
-
-# Create heatmap data (using "No symptom" rates as in reference)
-heatmap_data = regional_df.set_index('Region')[['Diarrhea', 'Fever', 'Ari']]
-
-# Create heatmap
-sns.heatmap(heatmap_data, annot=True, fmt='.1f', cmap='YlOrRd', 
-            linewidths=0.5, ax=ax, cbar_kws={'label': 'Prevalence (%)'})
-ax.set_xlabel('Health Indicator', fontsize=11)
-ax.set_ylabel('')
-ax.set_title("Figure 8: Regional Child Morbidity Indicators\nCameroon DHS 2018",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig8_regional_heatmap.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig8_regional_heatmap.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_7(stats, filename):
+    """Figure 8 - Regional Heatmap."""
+    regional_data = stats['regional_data']
+
+    fig = get_figure(10, 8)
+    ax = fig.subplots()
+
+    # Create heatmap data (using "No symptom" rates as in reference)
+    heatmap_arr = np.column_stack([regional_data['Diarrhea'], regional_data['Fever'],
+                                   regional_data['Ari']])
+
+    # Create heatmap
+    im = ax.imshow(heatmap_arr, cmap='YlOrRd', aspect='auto')
+    fig.colorbar(im, ax=ax, label='Prevalence (%)')
+    ax.set_xticks(range(3))
+    ax.set_xticklabels(['Diarrhea', 'Fever', 'ARI'])
+    ax.set_yticks(range(len(regional_data['Region'])))
+    ax.set_yticklabels(regional_data['Region'])
+    # White 0.5pt separators between cells, drawn over the image
+    ax.set_xticks(np.arange(heatmap_arr.shape[1] + 1) - 0.5, minor=True)
+    ax.set_yticks(np.arange(heatmap_arr.shape[0] + 1) - 0.5, minor=True)
+    ax.grid(False)
+    ax.grid(which='minor', color='white', linewidth=0.5)
+    ax.set_axisbelow(False)
+    # Dark text on light cells and white on dark ones, chosen by relative
+    # luminance of the cell colour with the same 0.408 cut-off seaborn uses
+    rgb = im.cmap(im.norm(heatmap_arr))[..., :3]
+    rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    luminance = rgb @ [0.2126, 0.7152, 0.0722]
+    for i, j in np.ndindex(heatmap_arr.shape):
+        ax.text(j, i, f'{heatmap_arr[i, j]:.1f}', ha='center', va='center',
+                color='.15' if luminance[i, j] > 0.408 else 'white')
+    ax.set_xlabel('Health Indicator', fontsize=11)
+    ax.set_ylabel('')
+    ax.set_title("Figure 8: Regional Child Morbidity Indicators\nCameroon DHS 2018",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename, dpi=150)
 
 # ============================================================================
 # CHART 8: Figure 9 - Morbidity Prevalence and Treatment (Grouped Bar)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-
-conditions = ['Diarrhea', 'Fever', 'ARI Symptoms']
-prev_values = [round(diarrhea_prev), round(fever_prev), round(ari_prev)]
-treat_values = [round(diarrhea_treat), round(fever_treat), round(ari_treat)]
-
-x = np.arange(len(conditions))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, prev_values, width, label='Prevalence', color='#E57373')
-bars2 = ax.bar(x + width/2, treat_values, width, label='Treatment Sought', color='#81C784')
-
-ax.set_xlabel('Health Condition', fontsize=11)
-ax.set_ylabel('Percentage (%)', fontsize=11)
-ax.set_xticks(x)
-ax.set_xticklabels(conditions)
-ax.set_ylim(0, 80)
-ax.legend(loc='upper right')
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars1, prev_values):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, f'{val}%', 
-            ha='center', va='bottom', fontweight='bold', fontsize=10)
-for bar, val in zip(bars2, treat_values):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, f'{val}%', 
-            ha='center', va='bottom', fontweight='bold', fontsize=10)
-
-ax.set_title("Figure 9: Child Morbidity Prevalence and Treatment Seeking\n(Data from Excel files)",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig9_morbidity_treatment.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig9_morbidity_treatment.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_8(stats, filename):
+    """Figure 9 - Morbidity Prevalence and Treatment (Grouped Bar)."""
+    diarrhea_prev = stats['diarrhea_prev']
+    fever_prev = stats['fever_prev']
+    ari_prev = stats['ari_prev']
+    diarrhea_treat = stats['diarrhea_treat']
+    fever_treat = stats['fever_treat']
+    ari_treat = stats['ari_treat']
+
+    fig = get_figure(10, 6)
+    ax = fig.subplots()
+
+    conditions = ['Diarrhea', 'Fever', 'ARI Symptoms']
+    prev_values, treat_values = np.rint([[diarrhea_prev, fever_prev, ari_prev],
+                                         [diarrhea_treat, fever_treat, ari_treat]]).astype(int).tolist()
+
+    x = np.arange(len(conditions))
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, prev_values, width, label='Prevalence', color='#E57373')
+    bars2 = ax.bar(x + width/2, treat_values, width, label='Treatment Sought', color='#81C784')
+
+    ax.set_xlabel('Health Condition', fontsize=11)
+    ax.set_ylabel('Percentage (%)', fontsize=11)
+    ax.set_xticks(x)
+    ax.set_xticklabels(conditions)
+    ax.set_ylim(0, 80)
+    ax.legend(loc='upper right')
+    ax.grid(axis='y', alpha=0.3)
+
+    ax.bar_label(bars1, labels=[f'{v}%' for v in prev_values], padding=3,
+                 fontweight='bold', fontsize=10)
+    ax.bar_label(bars2, labels=[f'{v}%' for v in treat_values], padding=3,
+                 fontweight='bold', fontsize=10)
+
+    ax.set_title("Figure 9: Child Morbidity Prevalence and Treatment Seeking\n(Data from Excel files)",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 9: Figure 11 - Feeding Practices (Grouped Bar - English)
 # ============================================================================
-fig, ax = plt.subplots(figsize=(12, 6))
-
-feeding_categories = ['More', 'Same', 'Less', 'Much Less', 'None']
-liquids = [round(liquid_more), round(liquid_same), round(liquid_less), 
-           round(liquid_much_less), round(liquid_none)]
-foods = [round(food_more), round(food_same), round(food_less), 
-         round(food_much_less), round(food_none)]
-
-x = np.arange(len(feeding_categories))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, liquids, width, label='Liquids', color='#5DADE2')
-bars2 = ax.bar(x + width/2, foods, width, label='Food', color='#F5B041')
-
-ax.set_xlabel('Amount Given During Diarrhea', fontsize=11)
-ax.set_ylabel('Percentage of Children (%)', fontsize=11)
-ax.set_xticks(x)
-ax.set_xticklabels(feeding_categories)
-ax.set_ylim(0, 50)
-ax.legend(loc='upper right')
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.grid(axis='y', alpha=0.3)
-
-# Add annotation
-ax.annotate('*Recommended: More liquids & same/more food*', 
-            xy=(0.5, 0.95), xycoords='axes fraction',
-            ha='center', fontsize=10, fontstyle='italic',
-            bbox=dict(boxstyle='round', facecolor='#FFFACD', alpha=0.8))
-
-ax.set_title("Figure 11: Feeding Practices During Diarrhea\n(Data from Excel files)",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig11_feeding_diarrhea.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig11_feeding_diarrhea.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_9(stats, filename):
+    """Figure 11 - Feeding Practices (Grouped Bar - English)."""
+    liquid_more = stats['liquid_more']
+    liquid_same = stats['liquid_same']
+    liquid_less = stats['liquid_less']
+    liquid_much_less = stats['liquid_much_less']
+    liquid_none = stats['liquid_none']
+    food_more = stats['food_more']
+    food_same = stats['food_same']
+    food_less = stats['food_less']
+    food_much_less = stats['food_much_less']
+    food_none = stats['food_none']
+
+    fig = get_figure(12, 6)
+    ax = fig.subplots()
+
+    feeding_categories = ['More', 'Same', 'Less', 'Much Less', 'None']
+    liquids, foods = np.rint([
+        [liquid_more, liquid_same, liquid_less, liquid_much_less, liquid_none],
+        [food_more, food_same, food_less, food_much_less, food_none],
+    ]).astype(int).tolist()
+
+    x = np.arange(len(feeding_categories))
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, liquids, width, label='Liquids', color='#5DADE2')
+    bars2 = ax.bar(x + width/2, foods, width, label='Food', color='#F5B041')
+
+    ax.set_xlabel('Amount Given During Diarrhea', fontsize=11)
+    ax.set_ylabel('Percentage of Children (%)', fontsize=11)
+    ax.set_xticks(x)
+    ax.set_xticklabels(feeding_categories)
+    ax.set_ylim(0, 50)
+    ax.legend(loc='upper right')
+    ax.grid(axis='y', alpha=0.3)
+
+    # Add annotation
+    ax.annotate('*Recommended: More liquids & same/more food*', 
+                xy=(0.5, 0.95), xycoords='axes fraction',
+                ha='center', fontsize=10, fontstyle='italic',
+                bbox=dict(boxstyle='round', facecolor='#FFFACD', alpha=0.8))
+
+    ax.set_title("Figure 11: Feeding Practices During Diarrhea\n(Data from Excel files)",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename)
 
 # ============================================================================
 # CHART 10: Figure 3 - Diarrhea Prevalence by Age (Line/Area Chart)
 # Note: Using "No diarrhea" rates as shown in reference image
 # ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-
-age_display = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59']
-# Get "No diarrhea" values for area chart (as shown in reference)
-no_diarrhea = []
-for label in age_labels_raw:
-    row = df_diarrhea[df_diarrhea['row_labels'].str.contains(f'|{label}', regex=False, na=False)]
-    if not row.empty:
-        no_diarrhea.append(row.iloc[0]['Diarrhea in the 2 weeks before the survey|No'])
-
-ax.fill_between(range(len(age_display)), no_diarrhea, alpha=0.3, color='#E57373')
-ax.plot(range(len(age_display)), no_diarrhea, marker='o', markersize=10, 
-        color='#D35400', linewidth=3, markerfacecolor='white', markeredgewidth=3)
-
-ax.set_xticks(range(len(age_display)))
-ax.set_xticklabels(age_display)
-ax.set_xlabel('Child Age (months)', fontsize=11)
-ax.set_ylabel('Diarrhea Prevalence (%)', fontsize=11)
-ax.set_ylim(70, 100)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.grid(alpha=0.3)
-
-for i, val in enumerate(no_diarrhea):
-    ax.text(i, val + 1.5, f'{val:.1f}%', ha='center', fontweight='bold', fontsize=10)
-
-ax.set_title("Figure 3: Diarrhea Prevalence by Child Age\n(Two weeks preceding survey)",
-             fontsize=12, fontweight='bold')
-plt.tight_layout()
-plt.savefig('output/fig3_diarrhea_age.png', bbox_inches='tight', facecolor='white')
-plt.close()
-print("  ✓ Saved: fig3_diarrhea_age.png")
+@plt.rc_context(CHART_STYLE)
+def make_chart_10(stats, filename):
+    """Figure 3 - Diarrhea Prevalence by Age (Line/Area Chart)."""
+    no_diarrhea = stats['no_diarrhea']
+
+    fig = get_figure(10, 6)
+    ax = fig.subplots()
+
+    age_display = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59']
+
+    ax.fill_between(range(len(age_display)), no_diarrhea, alpha=0.3, color='#E57373')
+    ax.plot(range(len(age_display)), no_diarrhea, marker='o', markersize=10, 
+            color='#D35400', linewidth=3, markerfacecolor='white', markeredgewidth=3)
+
+    ax.set_xticks(range(len(age_display)))
+    ax.set_xticklabels(age_display)
+    ax.set_xlabel('Child Age (months)', fontsize=11)
+    ax.set_ylabel('Diarrhea Prevalence (%)', fontsize=11)
+    ax.set_ylim(70, 100)
+    ax.grid(alpha=0.3)
+
+    for i, val in enumerate(no_diarrhea):
+        ax.text(i, val + 1.5, f'{val:.1f}%', ha='center', fontweight='bold', fontsize=10)
+
+    ax.set_title("Figure 3: Diarrhea Prevalence by Child Age\n(Two weeks preceding survey)",
+                 fontsize=12, fontweight='bold')
+    return save_chart(fig, filename)
+
+# Each chart function with the PNG it writes to output/
+CHARTS = [
+    (make_chart_1, 'graphique_10_8_prevalence_treatment.png'),
+    (make_chart_2, 'graphique_10_6_diarrhea_age.png'),
+    (make_chart_3, 'graphique_10_5_diarrhea_treatment.png'),
+    (make_chart_4, 'graphique_10_7_feeding_practices.png'),
+    (make_chart_5, 'fig5_ors_wealth.png'),
+    (make_chart_6, 'fig7_careseeking_education.png'),
+    (make_chart_7, 'fig8_regional_heatmap.png'),
+    (make_chart_8, 'fig9_morbidity_treatment.png'),
+    (make_chart_9, 'fig11_feeding_diarrhea.png'),
+    (make_chart_10, 'fig3_diarrhea_age.png'),
+]
+
+# Digest of the values (and code) behind the last chart rendering, plus a
+# hash of each PNG that rendering wrote
+STATS_HASH_PATH = 'output/.stats_hash'
+
+def stats_digest(stats):
+    """Hash the extracted values together with this script's source.
+
+    Identical inputs and code render identical charts, so a matching digest
+    means the PNGs in output/ are already current.
+    """
+    h = hashlib.sha256(json.dumps(stats, sort_keys=True).encode())
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()[:16]
+
+def charts_are_current(digest):
+    """Check that every chart in output/ was written by a render of these stats.
+
+    The PNG hashes catch charts replaced since that render, e.g. by a git
+    checkout of output/. A missing or unreadable sidecar counts as stale.
+    """
+    try:
+        with open(STATS_HASH_PATH) as f:
+            recorded = json.load(f)
+        return (recorded['stats'] == digest
+                and all(file_sha1(os.path.join('output', filename)) == recorded['charts'][filename]
+                        for _, filename in CHARTS))
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+def record_charts(digest):
+    """Write the sidecar checked by charts_are_current() after a render."""
+    charts = {filename: file_sha1(os.path.join('output', filename)) for _, filename in CHARTS}
+    with open(STATS_HASH_PATH, 'w') as f:
+        json.dump({'stats': digest, 'charts': charts}, f)
 
 # ============================================================================
-# GENERATE REPORT
+# REPORT
 # ============================================================================
-print("\n" + "="*70)
-print("GENERATING REPORT")
-print("="*70)
-
-report_content = f"""# Child Health Analysis Report
+# Markdown report; every {field} is a key of the stats dict built in main()
+REPORT_TEMPLATE = """# Child Health Analysis Report
 ## Cameroon Demographic and Health Survey 2018
 
 **Author:** Momeni Gilles  
@@ -710,11 +883,216 @@ All data extracted from:
 **Reference:** Cameroon Demographic and Health Survey 2018, Institut National de la Statistique (INS) and ICF.
 """
 
-with open('output/Child_Health_Report_Cameroon_DHS2018.md', 'w') as f:
-    f.write(report_content)
-print("  ✓ Saved: Child_Health_Report_Cameroon_DHS2018.md")
+def format_report(stats):
+    """Render the Markdown report from the extracted indicator values."""
+    return REPORT_TEMPLATE.format(**stats)
 
-print("\n" + "="*70)
-print("ANALYSIS COMPLETE!")
-print("Output directory: output/")
-print("="*70)
+# ============================================================================
+# MAIN
+# ============================================================================
+def main(argv=None):
+    """Extract the indicators, render all charts and write the report."""
+    parser = argparse.ArgumentParser(description='Cameroon DHS 2018 - Child Health Analysis')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='re-parse the .xls workbooks instead of using the Feather sheet cache')
+    parser.add_argument('--force-render', action='store_true',
+                        help='render every chart even if output/ is up to date with the data')
+    parser.add_argument('--gzip-report', action='store_true',
+                        help='also write a gzip-compressed copy of the report (.md.gz)')
+    args = parser.parse_args(argv)
+
+    os.makedirs('output', exist_ok=True)
+
+    print("="*70)
+    print("EXTRACTING DATA FROM EXCEL FILES")
+    print("="*70)
+
+    # Load all Excel files and index rows by label
+    sheets = {}
+    for xls_path, sheet_names in WORKBOOK_SHEETS.items():
+        frames = load_sheets(xls_path, sheet_names, use_cache=not args.no_cache)
+        sheets.update({name: index_by_label(df) for name, df in frames.items()})
+    df_diarrhea = sheets['Diarrhea']
+    df_feeding = sheets['Feeding']
+    df_ors = sheets['ORS']
+    df_ari = sheets['ARI']
+    df_fever = sheets['Fever']
+
+    # --- Extract Total Values ---
+    # Diarrhea totals
+    diarrhea_total = get_total_row(df_diarrhea)
+    diarrhea_prev = diarrhea_total['Diarrhea in the 2 weeks before the survey|Yes']
+    diarrhea_treat = diarrhea_total['Advice or treatment sought for diarrhea|Yes']
+
+    # ARI totals
+    ari_total = get_total_row(df_ari)
+    ari_prev = ari_total['ARI symptoms in the 2 weeks before the survey|Yes']
+    ari_treat = ari_total['Advice or treatment sought for ARI symptoms|Yes']
+
+    # Fever totals
+    fever_total = get_total_row(df_fever)
+    fever_prev = fever_total['Fever symptoms in the 2 weeks before the survey|Yes']
+    fever_treat = fever_total['Advice or treatment sought for fever symptoms|Yes']
+
+    print(f"  Diarrhea: {diarrhea_prev:.1f}% prevalence, {diarrhea_treat:.1f}% treatment")
+    print(f"  Fever: {fever_prev:.1f}% prevalence, {fever_treat:.1f}% treatment")
+    print(f"  ARI: {ari_prev:.1f}% prevalence, {ari_treat:.1f}% treatment")
+
+    # --- Extract Diarrhea by Age ---
+    # Yes (Graphique 10.6) and No (Figure 3 area chart, as shown in reference)
+    # come from the same rows, so both columns are gathered together
+    age_category = 'age of child in months categories: 0-59'
+    age_labels_raw = ['<6', '6-11', '12-23', '24-35', '36-47', '48-59']
+    age_rows = get_category_rows(df_diarrhea, age_category).reindex(age_labels_raw, fill_value=0)[
+        ['Diarrhea in the 2 weeks before the survey|Yes',
+         'Diarrhea in the 2 weeks before the survey|No']]
+    diarrhea_by_age = age_rows.iloc[:, 0].tolist()
+    no_diarrhea = age_rows.iloc[:, 1].tolist()
+
+    print(f"  Diarrhea by age: {[round(x,1) for x in diarrhea_by_age]}")
+
+    # --- Extract ORS Treatment Data ---
+    ors_total = get_total_row(df_ors)
+    ors_rate = ors_total['Given oral rehydration salts for diarrhea|Yes']
+    rhf_rate = ors_total['Given recommended homemade fluids for diarrhea|Yes']
+    ors_rhf = ors_total['Given either ORS or RHF for diarrhea|Yes']
+    zinc_rate = ors_total['Given zinc for diarrhea|Yes']
+    ors_zinc = ors_total['Given zinc and ORS for diarrhea|Yes']
+    ors_fluids = ors_total['Given ORS or increased fluids for diarrhea|Yes']
+    tro_rate = ors_total['Given oral rehydration treatment or increased liquids for diarrhea|Yes']
+    antibiotics = ors_total['Given antibiotic drugs for diarrhea|Yes']
+    home_remedy = ors_total['Given home remedy or other treatment for diarrhea|Yes']
+    no_treatment = ors_total['No treatment for diarrhea|Yes']
+
+    print(f"  ORS: {ors_rate:.1f}%, TRO: {tro_rate:.1f}%, No treatment: {no_treatment:.1f}%")
+
+    # --- Extract ORS by Wealth Quintile ---
+    wealth_labels = ['poorest', 'poorer', 'middle', 'richer', 'richest']
+    ors_by_wealth = (get_category_rows(df_ors, 'wealth index combined')
+                     ['Given oral rehydration salts for diarrhea|Yes']
+                     .reindex(wealth_labels).dropna().tolist())
+
+    print(f"  ORS by wealth: {[round(x,1) for x in ors_by_wealth]}")
+
+    # --- Extract Care-seeking by Education ---
+    edu_labels = ['no education', 'primary', 'secondary', 'higher']
+    care_by_edu = (get_category_rows(df_fever, 'highest educational level')
+                   ['Advice or treatment sought for fever symptoms|Yes']
+                   .reindex(edu_labels).dropna().tolist())
+
+    print(f"  Care-seeking by education: {[round(x,1) for x in care_by_edu]}")
+
+    # --- Extract Feeding Data ---
+    feeding_total = get_total_row(df_feeding)
+    feeding_levels = ['More', 'Same as usual', 'Somewhat less', 'Much less', 'None']
+    liquid_more, liquid_same, liquid_less, liquid_much_less, liquid_none = feeding_total[
+        [f'Amount of liquids given for child with diarrhea|{level}' for level in feeding_levels]]
+    food_more, food_same, food_less, food_much_less, food_none = feeding_total[
+        [f'Amount of food given for child with diarrhea|{level}' for level in feeding_levels]]
+
+    print(f"  Liquids: More {liquid_more:.1f}%, Same {liquid_same:.1f}%")
+    print(f"  Food: More {food_more:.1f}%, Same {food_same:.1f}%")
+
+    # --- Extract Regional Data ---
+    regions_list = ['adamawa', 'centre (without yaounde)', 'douala', 'east', 'far-north',
+                    'littoral (without douala)', 'north', 'north-west', 'west', 'south', 
+                    'south-west', 'yaounde']
+    region_names = ['Adamawa', 'Centre (Without Yaounde)', 'Douala', 'East', 'Far-North',
+                    'Littoral (Without Douala)', 'North', 'North-West', 'West', 'South',
+                    'South-West', 'Yaounde']
+
+    # Align the diarrhea, fever and ARI NO symptom columns on the region key in
+    # one concat; regions missing from any of the sheets are dropped
+    regional_df = pd.concat([
+        get_category_rows(df_diarrhea, 'region')['Diarrhea in the 2 weeks before the survey|No']
+        .rename('Diarrhea'),
+        get_category_rows(df_fever, 'region')['Fever symptoms in the 2 weeks before the survey|No']
+        .rename('Fever'),
+        get_category_rows(df_ari, 'region')['ARI symptoms in the 2 weeks before the survey|No']
+        .rename('Ari'),
+    ], axis=1).reindex(regions_list).dropna()
+    regional_df.insert(0, 'Region', regional_df.index.map(dict(zip(regions_list, region_names))))
+    regional_data = regional_df.to_dict('list')
+    print(f"  Loaded regional data for {len(regional_df)} regions")
+
+    # Charts and the report only receive these scalars and lists, which
+    # pickle cheaply to the worker processes (no dataframes are sent)
+    stats = {
+        'ari_prev': ari_prev, 'ari_treat': ari_treat,
+        'fever_prev': fever_prev, 'fever_treat': fever_treat,
+        'diarrhea_prev': diarrhea_prev, 'diarrhea_treat': diarrhea_treat,
+        'diarrhea_by_age': diarrhea_by_age, 'no_diarrhea': no_diarrhea,
+        'ors_rate': ors_rate, 'rhf_rate': rhf_rate, 'ors_rhf': ors_rhf,
+        'zinc_rate': zinc_rate, 'ors_zinc': ors_zinc, 'ors_fluids': ors_fluids,
+        'tro_rate': tro_rate, 'antibiotics': antibiotics,
+        'home_remedy': home_remedy, 'no_treatment': no_treatment,
+        'ors_by_wealth': ors_by_wealth, 'care_by_edu': care_by_edu,
+        'liquid_more': liquid_more, 'liquid_same': liquid_same,
+        'liquid_less': liquid_less, 'liquid_much_less': liquid_much_less,
+        'liquid_none': liquid_none,
+        'food_more': food_more, 'food_same': food_same, 'food_less': food_less,
+        'food_much_less': food_much_less, 'food_none': food_none,
+        'regional_data': regional_data,
+    }
+
+    # ============================================================================
+    # GENERATE CHARTS
+    # ============================================================================
+    print("\n" + "="*70)
+    print("GENERATING CHARTS")
+    print("="*70)
+
+    digest = stats_digest(stats)
+    charts_current = not args.force_render and charts_are_current(digest)
+
+    with ExitStack() as stack:
+        futures = []
+        if charts_current:
+            print("  Charts are up to date with the extracted data, skipping rendering")
+        else:
+            # Each chart builds its own figure and writes its own PNG, so they
+            # render independently in worker processes
+            ex = stack.enter_context(ProcessPoolExecutor(
+                max_workers=min(len(CHARTS), os.cpu_count() or 1),
+                initializer=setup_matplotlib_for_plotting))
+            futures = [ex.submit(make_chart, stats, filename) for make_chart, filename in CHARTS]
+            print(f"  Rendering {len(futures)} charts in worker processes")
+
+        # ========================================================================
+        # GENERATE REPORT
+        # ========================================================================
+        # The report only needs stats, so it is written here while the
+        # submitted charts are still rendering in the workers
+        print("\n" + "="*70)
+        print("GENERATING REPORT")
+        print("="*70)
+
+        report_bytes = format_report(stats).encode('utf-8')
+        report_path = Path('output/Child_Health_Report_Cameroon_DHS2018.md')
+        # Write the encoded bytes as-is: '\n' line endings on every OS
+        report_path.write_bytes(report_bytes)
+        print("  ✓ Saved: Child_Health_Report_Cameroon_DHS2018.md")
+        if args.gzip_report:
+            gz_path = report_path.with_name(report_path.name + '.gz')
+            gz_path.write_bytes(gzip.compress(report_bytes, compresslevel=1, mtime=0))
+            print("  ✓ Saved: Child_Health_Report_Cameroon_DHS2018.md.gz")
+
+        # ========================================================================
+        # COLLECT CHARTS
+        # ========================================================================
+        if futures:
+            print("\n" + "="*70)
+            print("COLLECTING CHARTS")
+            print("="*70)
+            for future in futures:
+                print(f"  ✓ Saved: {future.result()}")
+            record_charts(digest)
+
+    print("\n" + "="*70)
+    print("ANALYSIS COMPLETE!")
+    print("Output directory: output/")
+    print("="*70)
+
+
+if __name__ == '__main__':
+    main()